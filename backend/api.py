@@ -4,7 +4,7 @@ Provides robust API endpoints with error handling, validation, and comprehensive
 """
 import os
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional, Union
 from uuid import UUID
 
@@ -19,7 +19,7 @@ from pydantic import BaseModel, Field, validator, constr
 from pydantic.json import timedelta_isoformat
 
 from db import db_manager, articles_collection
-from models import create_article_dict
+from models import create_article_dict, utc_isoformat
 
 # Configure logging
 logging.basicConfig(
@@ -170,6 +170,11 @@ async def verify_api_key(api_key: str = Depends(api_key_header)):
         )
     return True
 
+# Check the database connection and indexes once the server starts
+@app.on_event("startup")
+def connect_database():
+    db_manager.connect()
+
 # Create custom exception handler
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
@@ -221,7 +226,7 @@ async def health_check(_: bool = Depends(verify_api_key)):
             "version": API_VERSION,
             "database": "connected",
             "article_count": article_count,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utc_isoformat()
         })
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -453,7 +458,7 @@ async def toggle_saved_status(
         # Update the article
         result = articles_collection.update_one(
             {"id": article_id},
-            {"$set": {"saved": new_status, "updatedAt": datetime.utcnow().isoformat()}}
+            {"$set": {"saved": new_status, "updatedAt": utc_isoformat()}}
         )
         
         if result.modified_count < 1:
@@ -550,7 +555,7 @@ async def get_dashboard_stats(_: bool = Depends(verify_api_key)):
         saved_articles = articles_collection.count_documents({"saved": True})
         
         # Get recent articles (last 24h)
-        yesterday = (datetime.utcnow() - timedelta(days=1)).isoformat()
+        yesterday = utc_isoformat(datetime.now(timezone.utc) - timedelta(days=1))
         recent_articles = articles_collection.count_documents({"publishedAt": {"$gte": yesterday}})
         
         # Get category counts
@@ -615,7 +620,7 @@ async def get_trending_articles(
     """
     try:
         # Calculate the date threshold
-        threshold_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        threshold_date = utc_isoformat(datetime.now(timezone.utc) - timedelta(days=days))
         
         # Find trending articles
         articles = list(articles_collection.find({
@@ -10,6 +10,8 @@ from pymongo.collection import Collection
 from pymongo.errors import ConnectionFailure, ServerSelectionTimeoutError
 from dotenv import load_dotenv
 
+from models import utc_isoformat
+
 # Load environment variables
 load_dotenv()
 
@@ -37,35 +39,34 @@ class DatabaseManager:
     def __init__(self, uri: str = MONGODB_URI, db_name: str = DB_NAME):
         self.uri = uri
         self.db_name = db_name
-        self.client = None
-        self.db = None
-        self.articles = None
-        self.analytics = None
-        self.connect()
+        
+        # connect=False defers sockets and monitor threads to the first operation,
+        # so creating the manager (and importing this module) opens nothing
+        self.client = MongoClient(
+            self.uri,
+            maxPoolSize=50,
+            connectTimeoutMS=5000,
+            socketTimeoutMS=10000,
+            serverSelectionTimeoutMS=5000,
+            connect=False
+        )
+        
+        # Get the database and collections
+        self.db = self.client.get_database(self.db_name)
+        self.articles = self.db.articles
+        self.analytics = self.db.analytics
     
     def connect(self) -> bool:
-        """Establish connection to MongoDB and set up collections"""
+        """
+        Check the connection to MongoDB and set up indexes.
+        Called once by each entry point rather than at import, because the scraper's
+        parse-pool workers re-import the launching script and must not connect.
+        """
         for attempt in range(MAX_RETRY_ATTEMPTS):
             try:
-                # Connect with connection pooling and timeouts
-                self.client = MongoClient(
-                    self.uri,
-                    maxPoolSize=50,
-                    connectTimeoutMS=5000,
-                    socketTimeoutMS=10000,
-                    serverSelectionTimeoutMS=5000
-                )
-                
                 # Force a command to check the connection
                 self.client.admin.command('ping')
                 
-                # Get the database
-                self.db = self.client.get_database(self.db_name)
-                
-                # Set up collections
-                self.articles = self.db.articles
-                self.analytics = self.db.analytics
-                
                 # Set up indexes
                 self._setup_indexes()
                 
@@ -111,6 +112,14 @@ class DatabaseManager:
         """Find an article by its URL"""
         return self.articles.find_one({"fullArticleUrl": url})
     
+    def find_existing_urls(self, urls: List[str]) -> set:
+        """Return which of the given URLs are already stored, using a single query"""
+        cursor = self.articles.find(
+            {"fullArticleUrl": {"$in": urls}},
+            {"fullArticleUrl": 1, "_id": 0}
+        )
+        return {doc["fullArticleUrl"] for doc in cursor}
+    
     def find_articles(self, query: Dict[str, Any] = None, limit: int = 50, 
                     skip: int = 0, sort_by: str = "publishedAt", ascending: bool = False) -> List[Dict[str, Any]]:
         """Find articles based on query parameters"""
@@ -139,7 +148,7 @@ class DatabaseManager:
         """Update an article by ID"""
         result = self.articles.update_one(
             {"id": article_id},
-            {"$set": {**update_data, "updatedAt": time.time()}}
+            {"$set": {**update_data, "updatedAt": utc_isoformat()}}
         )
         return result.modified_count > 0
     
@@ -147,7 +156,7 @@ class DatabaseManager:
         """Increment article view count"""
         result = self.articles.update_one(
             {"id": article_id},
-            {"$inc": {"viewCount": 1}, "$set": {"updatedAt": time.time()}}
+            {"$inc": {"viewCount": 1}, "$set": {"updatedAt": utc_isoformat()}}
         )
         return result.modified_count > 0
     
@@ -160,7 +169,7 @@ class DatabaseManager:
         new_status = not article.get("saved", False)
         result = self.articles.update_one(
             {"id": article_id},
-            {"$set": {"saved": new_status, "updatedAt": time.time()}}
+            {"$set": {"saved": new_status, "updatedAt": utc_isoformat()}}
         )
         return result.modified_count > 0
     
@@ -207,6 +216,7 @@ atexit.register(db_manager.close)
 if __name__ == "__main__":
     # Test database connection
     try:
+        db_manager.connect()
         print(f"Connected to database: {db_manager.db_name}")
         print(f"Articles collection exists: {db_manager.articles is not None}")
         print(f"Article count: {db_manager.articles.count_documents({})}")
@@ -3,14 +3,17 @@ Enhanced module for fetching, processing and storing news articles
 """
 import time
 import logging
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from cachetools import LRUCache
 
 from scraper import SOURCES, get_article_links, scrape_article
 from summarizer import summarize_text
-from models import create_article_dict
-from db import articles_collection
+from models import create_article_dict, utc_isoformat
+from db import articles_collection, db_manager
 
 # Configure logging
 logging.basicConfig(
@@ -20,15 +23,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger("fetch_and_store")
 
-# Maximum number of worker threads
+# Maximum number of article worker threads per source being processed
 MAX_WORKERS = 5
 
+# Maximum number of sources processed concurrently
+MAX_SOURCE_WORKERS = 6
+
+# Long-lived worker pools shared by every run, so the per-thread HTTP sessions
+# (scraper._session, summarizer._session) stay warm between runs
+_source_executor = ThreadPoolExecutor(max_workers=MAX_SOURCE_WORKERS, thread_name_prefix="source")
+_article_executor = ThreadPoolExecutor(max_workers=MAX_WORKERS * MAX_SOURCE_WORKERS, thread_name_prefix="article")
+
 # Maximum articles to process per source
 MAX_ARTICLES_PER_SOURCE = 15
 
-def article_exists(url: str) -> bool:
-    """Check if an article with the given URL already exists in the database."""
-    return articles_collection.find_one({"fullArticleUrl": url}) is not None
+# Normalized URLs of articles recently taken on by a source, so a story reached through
+# another source or a tracking-parameter variant of its URL is only fetched once
+_claimed_urls = LRUCache(maxsize=10000)
+_claimed_urls_lock = threading.Lock()
+
+def normalize_url(url: str) -> str:
+    """Normalize an article URL for deduplication: lowercase host, no scheme, query, fragment or trailing slash."""
+    parts = urlsplit(url)
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}"
+
+def claim_urls(urls: List[str], limit: int) -> List[str]:
+    """Claim up to `limit` URLs that no source has claimed yet, skipping duplicates within `urls`."""
+    claimed = []
+    with _claimed_urls_lock:
+        for url in urls:
+            key = normalize_url(url)
+            if key in _claimed_urls:
+                continue
+            _claimed_urls[key] = True
+            claimed.append(url)
+            if len(claimed) >= limit:
+                break
+    return claimed
+
+def release_url(url: str):
+    """Release a claimed URL so a later run can try it again."""
+    with _claimed_urls_lock:
+        _claimed_urls.pop(normalize_url(url), None)
 
 def analyze_sentiment(text: str) -> str:
     """
@@ -53,43 +89,41 @@ def analyze_sentiment(text: str) -> str:
         return "neutral"
 
 def process_article(url: str, source_name: str) -> Optional[Dict[str, Any]]:
-    """Process a single article URL - scrape, summarize, analyze."""
+    """
+    Process a single article URL - scrape, summarize, analyze.
+    Callers skip URLs that are already stored (see process_source).
+    """
     try:
-        # Skip if article already exists
-        if article_exists(url):
-            logger.debug(f"Article already exists: {url}")
-            return None
-            
         # Scrape the article
         scraped = scrape_article(url)
-        if not scraped or not scraped.get("text"):
+        if not scraped or not scraped.text:
             logger.warning(f"Failed to scrape article: {url}")
             return None
             
         # Get the category
-        category = scraped.get("category", "general")
+        category = scraped.category
         
         # Generate summary
         summary = summarize_text(
-            scraped["text"], 
+            scraped.text, 
             source=source_name,
             category=category
         )
         
         # Analyze sentiment
-        sentiment = analyze_sentiment(scraped["text"])
+        sentiment = analyze_sentiment(scraped.text)
         
         # Create article document
         article_doc = create_article_dict(
-            title=scraped["title"],
+            title=scraped.title,
             summary=summary,
-            full_text=scraped["text"],
+            full_text=scraped.text,
             url=url,
-            image_url=scraped.get("image_url", ""),
+            image_url=scraped.image_url,
             source=source_name,
-            published_at=scraped.get("published_at"),
+            published_at=scraped.published_at,
             category=category,
-            keywords=scraped.get("keywords", []),
+            keywords=scraped.keywords,
             sentiment=sentiment
         )
         
@@ -124,30 +158,40 @@ def process_source(source_name: str, feed_url: str) -> int:
             logger.warning(f"No links found for {source_name}")
             return 0
             
-        # Limit number of articles to process
-        links = links[:MAX_ARTICLES_PER_SOURCE]
+        # Skip articles stored by a previous run before fetching any of them
+        existing = db_manager.find_existing_urls(links)
+        links = [url for url in links if url not in existing]
+        if not links:
+            logger.info(f"No new articles for {source_name}")
+            return 0
+            
+        # Limit number of articles to process, skipping ones another source already took on
+        links = claim_urls(links, MAX_ARTICLES_PER_SOURCE)
+        if not links:
+            logger.info(f"No unclaimed articles for {source_name}")
+            return 0
         logger.info(f"Processing {len(links)} articles from {source_name}")
         
         articles_stored = 0
         
-        # Process articles in parallel with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            # Submit all tasks
-            future_to_url = {
-                executor.submit(process_article, url, source_name): url 
-                for url in links
-            }
-            
-            # Process completed tasks
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                try:
-                    article_doc = future.result()
-                    if article_doc:
-                        if store_article(article_doc):
-                            articles_stored += 1
-                except Exception as e:
-                    logger.error(f"Exception processing {url}: {e}")
+        # Process articles in parallel on the shared article pool
+        future_to_url = {
+            _article_executor.submit(process_article, url, source_name): url 
+            for url in links
+        }
+        
+        # Process completed tasks
+        for future in as_completed(future_to_url):
+            url = future_to_url[future]
+            try:
+                article_doc = future.result()
+                if article_doc and store_article(article_doc):
+                    articles_stored += 1
+                    continue
+            except Exception as e:
+                logger.error(f"Exception processing {url}: {e}")
+            # Not stored, so let a later run retry it
+            release_url(url)
         
         logger.info(f"Completed {source_name}: {articles_stored} new articles stored")
         return articles_stored
@@ -167,7 +211,7 @@ def clean_old_articles(days: int = 30) -> int:
         Number of articles removed
     """
     try:
-        cutoff_date = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        cutoff_date = utc_isoformat(datetime.now(timezone.utc) - timedelta(days=days))
         result = articles_collection.delete_many({
             "createdAt": {"$lt": cutoff_date},
             "saved": False  # Don't delete saved articles
@@ -190,12 +234,20 @@ def fetch_all_sources() -> Dict[str, int]:
     results = {}
     start_time = time.time()
     
-    for name, url in SOURCES.items():
-        articles_stored = process_source(name, url)
-        results[name] = articles_stored
-        
-        # Add a small delay between sources to be polite
-        time.sleep(2)
+    # Each source is on its own host, so sources are processed concurrently;
+    # make_request still spaces out requests within a source
+    future_to_source = {
+        _source_executor.submit(process_source, name, url): name
+        for name, url in SOURCES.items()
+    }
+    
+    for future in as_completed(future_to_source):
+        name = future_to_source[future]
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            logger.error(f"Exception processing source {name}: {e}")
+            results[name] = 0
     
     # Clean old articles
     clean_old_articles()
@@ -206,6 +258,7 @@ def fetch_all_sources() -> Dict[str, int]:
     return results
 
 if __name__ == "__main__":
+    db_manager.connect()
     results = fetch_all_sources()
     total_articles = sum(results.values())
     print(f"Total articles fetched: {total_articles}")
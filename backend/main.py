@@ -8,8 +8,8 @@ import logging
 from typing import Dict, Any
 
 # Import components
-from scraper import get_article_links, scrape_article, SOURCES
-from summarizer import summarize_text
+from scraper import collect_source_links, scrape_articles_bulk, SOURCES
+from summarizer import summarize_many
 from fetch_and_store import fetch_all_sources, process_source, clean_old_articles
 from scheduler import start_scheduler, stop_scheduler, generate_status_report
 from db import db_manager
@@ -28,11 +28,16 @@ def test_scraper(source_name: str = None):
         logger.error(f"Source '{source_name}' not found. Available sources: {', '.join(SOURCES.keys())}")
         return
     
-    sources_to_test = [source_name] if source_name else SOURCES.keys()
+    sources_to_test = [source_name] if source_name else list(SOURCES)
     
+    # Collect links from every source concurrently, then scrape each source's first article
+    source_links = collect_source_links(sources_to_test)
+    scraped = dict(scrape_articles_bulk([links[0] for links in source_links.values() if links]))
+    
+    to_summarize = []
     for src in sources_to_test:
         logger.info(f"Testing scraper for {src}")
-        links = get_article_links(src, SOURCES[src])
+        links = source_links[src]
         
         if not links:
             logger.warning(f"No links found for {src}")
@@ -41,19 +46,20 @@ def test_scraper(source_name: str = None):
         logger.info(f"Found {len(links)} links for {src}")
         
         # Test scraping the first article
-        if links:
-            logger.info(f"Testing article scraping for {links[0]}")
-            article = scrape_article(links[0])
-            
-            if article and article.get("title"):
-                logger.info(f"Successfully scraped: {article['title']}")
-                
-                # Test summarization
-                if article.get("text"):
-                    summary = summarize_text(article["text"], source=src)
-                    logger.info(f"Summary: {summary[:100]}...")
-            else:
-                logger.error(f"Failed to scrape article from {links[0]}")
+        logger.info(f"Testing article scraping for {links[0]}")
+        article = scraped.get(links[0])
+        
+        if article and article.title:
+            logger.info(f"Successfully scraped: {article.title}")
+            if article.text:
+                to_summarize.append((src, article))
+        else:
+            logger.error(f"Failed to scrape article from {links[0]}")
+    
+    # Test summarization for every scraped article at once
+    summaries = summarize_many([(article.text, src, article.category) for src, article in to_summarize])
+    for (src, article), summary in zip(to_summarize, summaries):
+        logger.info(f"Summary for {src}: {summary[:100]}...")
 
 def run_fetch_job():
     """Run a single fetch job across all sources"""
@@ -118,6 +124,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Every command except the scraper test uses the database
+    if args.command and args.command != "test":
+        db_manager.connect()
+    
     # Execute the appropriate command
     if args.command == "test":
         test_scraper(args.source)
@@ -2,9 +2,22 @@
 Enhanced data models for the news aggregation system
 """
 from uuid import uuid4
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
+def utc_isoformat(dt: Optional[datetime] = None) -> str:
+    """
+    Format a datetime (default: now) the way every stored timestamp is formatted:
+    ISO 8601 in UTC to the second, e.g. "2024-05-01T12:00:00+00:00".
+    Naive datetimes are taken to be UTC. A single fixed-width format keeps the
+    string comparisons used for date filters in chronological order.
+    """
+    if dt is None:
+        dt = datetime.now(timezone.utc)
+    elif dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat(timespec="seconds")
+
 def create_article_dict(
     title: str, 
     summary: str, 
@@ -37,18 +50,23 @@ def create_article_dict(
     Returns:
         Dictionary with article data
     """
+    # Count words once for both the reading time and the stored word count
+    word_count = len(full_text.split()) if full_text else 0
+    
     # Calculate reading time if not provided
     if read_time is None and full_text:
         # Average reading speed is around 200-250 words per minute
-        word_count = len(full_text.split())
         read_time = max(1, round(word_count / 200))
     
     # Generate article ID based on URL to avoid duplicates
     unique_id = str(uuid4())
     
+    # One timestamp serves every date field set here
+    now = utc_isoformat()
+    
     # Use current time if published date is not available
     if not published_at:
-        published_at = datetime.utcnow().isoformat()
+        published_at = now
     
     # Normalize category
     if not category or category.lower() == "none":
@@ -68,12 +86,12 @@ def create_article_dict(
         "source": source,
         "category": category.lower(),
         "publishedAt": published_at,
-        "createdAt": datetime.utcnow().isoformat(),
-        "updatedAt": datetime.utcnow().isoformat(),
+        "createdAt": now,
+        "updatedAt": now,
         "keywords": keywords,
         "sentiment": sentiment,
         "readTimeMinutes": read_time,
-        "wordCount": len(full_text.split()) if full_text else 0,
+        "wordCount": word_count,
         "saved": False,
         "viewCount": 0,
         "hasImage": bool(image_url)
@@ -117,9 +117,9 @@ def process_article(url: str) -> bool:
             
         # Summarize
         summary = summarize_text(
-            article_data["text"], 
-            source=article_data.get("source", ""),
-            category=article_data.get("category", "general")
+            article_data.text, 
+            source="",
+            category=article_data.category
         )
         
         return bool(summary)
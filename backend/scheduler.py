@@ -8,6 +8,7 @@ import logging
 import os
 import signal
 import json
+import orjson
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Callable
@@ -74,8 +75,8 @@ def load_config() -> Dict[str, Any]:
 def save_status():
     """Save current job status to file"""
     try:
-        with open(STATUS_PATH, 'w') as f:
-            json.dump(job_status, f, indent=2, default=str)
+        with open(STATUS_PATH, 'wb') as f:
+            f.write(orjson.dumps(job_status, default=str, option=orjson.OPT_INDENT_2))
     except Exception as e:
         logger.error(f"Error saving status: {e}")
 
@@ -193,8 +194,8 @@ def generate_status_report():
                    f"Uptime: {report['uptime']:.1f} hours")
                    
         # Save detailed report to file
-        with open("status_report.json", "w") as f:
-            json.dump(report, f, indent=2, default=str)
+        with open("status_report.json", "wb") as f:
+            f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2))
             
     except Exception as e:
         logger.error(f"Error generating status report: {e}")
@@ -273,6 +274,7 @@ if __name__ == "__main__":
     try:
         logger.info("News scraper scheduler starting up")
         logger.info(f"Current configuration: {load_config()}")
+        db_manager.connect()
         
         # Start the scheduler
         start_scheduler()
@@ -2,26 +2,44 @@
 Enhanced web scraper for news articles
 Includes source-specific extraction, proper user-agent, rate limiting, and better error handling
 """
+import os
+import re
+import sys
 import time
 import random
+import threading
+import multiprocessing
 import requests
-from typing import List, Dict, Optional
+import feedparser
+import trafilatura
+from trafilatura.settings import set_date_params
+import ahocorasick
+from cachetools import TTLCache
+import soupsieve
+from collections import defaultdict
+from functools import lru_cache
+from operator import methodcaller
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Union, Iterator, Tuple
+from urllib.parse import urljoin, urlparse, urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+from lxml.cssselect import CSSSelector
+from selectolax.lexbor import LexborHTMLParser
 from newspaper import Article, ArticleException
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import logging
 
 import nltk
 
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('tokenizers/punkt_tab')
-except LookupError:
-    nltk.download('punkt_tab')
+from models import utc_isoformat
 
 # Configure logging
 logging.basicConfig(
@@ -36,6 +54,7 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br",
     "Connection": "keep-alive",
     "Cache-Control": "max-age=0",
     "Referer": "https://www.reuters.com",
@@ -47,6 +66,64 @@ HEADERS = {
     "DNT": "1"
 }
 
+@dataclass(slots=True)
+class ScrapedArticle:
+    """Article content extracted from a news page"""
+    title: str
+    text: str
+    url: str
+    image_url: str = ""
+    published_at: str = ""
+    keywords: List[str] = field(default_factory=list)
+    category: str = "general"
+    source_summary: str = ""
+
+# Articles with less body text than this are treated as failed extractions
+MIN_ARTICLE_CHARS = 100
+
+@dataclass(frozen=True, slots=True)
+class SourceSpec:
+    """How to find article links on a source's landing page."""
+    link_selector: str  # CSS selector for candidate links, all alternatives in one so the tree is walked once
+    base_url: str  # Base for resolving relative links
+    link_prefixes: Tuple[str, ...]  # Host-and-path prefixes (no scheme or "www.") an article link must start with
+
+# Stop streaming a landing page once this many generic article links are found
+MAX_STREAMED_LINKS = 40
+
+# HTML backend for landing-page link extraction: "selectolax" (fast) or "bs4"
+LINK_PARSER = os.getenv("LINK_PARSER", "selectolax").lower()
+
+# Maximum number of concurrent requests to a single host
+MAX_REQUESTS_PER_HOST = 4
+
+# Per-host semaphores so concurrent scraping stays polite to each site
+_host_semaphores = defaultdict(lambda: threading.Semaphore(MAX_REQUESTS_PER_HOST))
+_host_semaphores_lock = threading.Lock()
+
+# Per-host politeness pacing: the earliest time the next landing-page request may start
+_host_buckets = defaultdict(lambda: {"next": 0.0, "lock": threading.Lock()})
+_host_buckets_lock = threading.Lock()
+
+# Number of worker processes for CPU-bound article parsing/NLP
+PARSE_WORKERS = int(os.getenv("PARSE_WORKERS", os.cpu_count() or 1))
+
+# Seconds to wait for a worker to parse one article
+PARSE_TIMEOUT = 60
+
+# Workers are started from a dedicated server process (spawned on Windows) rather
+# than forked, since the pool is created from inside multi-threaded scraping.
+# Each worker re-imports the launching script as __mp_main__, so that script and
+# everything it imports must not connect to the database or do other work at import.
+PARSE_START_METHOD = "spawn" if sys.platform == "win32" else "forkserver"
+
+# Process pool for newspaper3k parsing, created lazily on first use
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+# Whether the NLTK tokenizer data has been confirmed in this process
+_nltk_ready = False
+
 # Define news sources with their RSS/archive URLs
 SOURCES = {
     "Reuters": "https://www.reuters.com/news/archive/worldNews",
@@ -57,6 +134,78 @@ SOURCES = {
     "Al Jazeera": "https://www.aljazeera.com/news/",
 }
 
+# Reuters article selectors, compiled once to XPath and tried in order for each field
+REUTERS_TITLE_SELECTORS = [CSSSelector(selector) for selector in (
+    "h1[data-testid='Heading']",
+    "h1.article-header__title__3Y2hh",
+    "h1.text__text__1FZLe",
+    ".article-header h1"
+)]
+REUTERS_CONTENT_SELECTORS = [CSSSelector(selector) for selector in (
+    "p[data-testid='paragraph-']",  # Numbered paragraphs
+    ".article-body__content__17Yit p",
+    ".paywall-article p",
+    ".article__content p",
+    ".StandardArticleBody_body p",
+    ".article-body p"  # New Reuters format
+)]
+REUTERS_IMAGE_SELECTORS = [CSSSelector(selector) for selector in (
+    "img[data-testid='Image']",
+    ".article-header__image__2nPGa img",
+    ".article__hero-image img",
+    "meta[property='og:image']",
+    ".article-body img"  # New Reuters format
+)]
+REUTERS_DATE_SELECTORS = [CSSSelector(selector) for selector in (
+    "time",
+    "meta[property='article:published_time']",
+    ".ArticleHeader_date",
+    ".article-info time"  # New Reuters format
+)]
+
+# Fallback paragraph scan used when no content selector matches: only substantial
+# paragraphs without a caption/footer/header/meta class, filtered inside the XPath engine
+SKIP_PARAGRAPH_CLASSES = {"caption", "footer", "header", "meta"}
+SUBSTANTIAL_PARAGRAPHS = etree.XPath("//p[string-length(normalize-space()) > 50 and {}]".format(
+    " and ".join(
+        f"not(contains(concat(' ', normalize-space(@class), ' '), ' {name} '))"
+        for name in sorted(SKIP_PARAGRAPH_CLASSES)
+    )
+))
+
+# Whitespace normalization for extracted paragraph text: runs containing a line break
+# separate paragraphs, any other run collapses to a single space
+PARAGRAPH_BREAK = re.compile(r"\s*\n\s*")
+INLINE_WHITESPACE = re.compile(r"[^\S\n]+")
+
+# RSS feeds for sources that publish one; these are tried before scraping
+# the HTML pages above (Reuters and AP News no longer offer public feeds)
+RSS_FEEDS = {
+    "NPR": "https://feeds.npr.org/1001/rss.xml",
+    "The Guardian": "https://www.theguardian.com/world/rss",
+    "BBC": "https://feeds.bbci.co.uk/news/world/rss.xml",
+    "Al Jazeera": "https://www.aljazeera.com/xml/rss/all.xml",
+}
+
+# Metadata from the most recent fetch of each feed, keyed by feed URL then article link
+_feed_entries: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+# Seconds to reuse extracted article links before asking the source again
+LINK_CACHE_TTL = 300
+
+# Recently extracted links, keyed by (source, landing page URL)
+_link_cache = TTLCache(maxsize=32, ttl=LINK_CACHE_TTL)
+_link_cache_lock = threading.Lock()
+
+# ETag/Last-Modified of the last successful fetch per URL, for conditional GETs
+_page_validators: Dict[str, Dict[str, Optional[str]]] = {}
+
+# Links extracted from each landing page, reused when it answers 304 Not Modified
+_page_links: Dict[str, List[str]] = {}
+
+# Returned by make_request when a conditional request finds the page unchanged
+NOT_MODIFIED = object()
+
 # Source-specific article link patterns to validate URLs
 URL_PATTERNS = {
     "Reuters": "reuters.com/",
@@ -67,218 +216,428 @@ URL_PATTERNS = {
     "Al Jazeera": "aljazeera.com/news/",
 }
 
-def make_request(url: str, timeout: int = 15) -> Optional[str]:
-    """Make an HTTP request with proper error handling and rate limiting."""
+# Comprehensive keyword-based categorization with weighted matching
+CATEGORY_KEYWORDS = {
+    "politics": [
+        "government", "election", "president", "minister", "parliament", "vote", "political",
+        "congress", "senate", "democracy", "policy", "legislation", "campaign", "diplomatic",
+        "republican", "democrat", "bill", "law", "federal", "governor"
+    ],
+    "technology": [
+        "tech", "computer", "software", "internet", "digital", "ai", "artificial intelligence",
+        "cybersecurity", "blockchain", "startup", "innovation", "app", "robot", "automation",
+        "machine learning", "programming", "data", "cloud", "virtual reality", "cryptocurrency"
+    ],
+    "business": [
+        "economy", "market", "stock", "trade", "company", "financial", "investment",
+        "revenue", "profit", "startup", "entrepreneur", "industry", "corporate", "commerce",
+        "banking", "inflation", "economic", "gdp", "nasdaq", "dow jones"
+    ],
+    "health": [
+        "covid", "virus", "disease", "medical", "hospital", "doctor", "healthcare", "health",
+        "patient", "treatment", "medicine", "vaccine", "research", "clinical", "drug",
+        "therapy", "mental health", "wellness", "diagnosis", "pharmaceutical"
+    ],
+    "entertainment": [
+        "movie", "film", "music", "celebrity", "actor", "actress", "concert",
+        "hollywood", "tv", "television", "streaming", "award", "star", "entertainment",
+        "show", "series", "album", "theater", "festival", "performance"
+    ],
+    "sports": [
+        "football", "soccer", "basketball", "tournament", "championship", "olympic", "player",
+        "game", "match", "team", "athlete", "sport", "baseball", "tennis", "golf",
+        "league", "coach", "score", "win", "competition"
+    ],
+    "science": [
+        "research", "scientist", "study", "discovery", "space", "nasa", "physics", "biology",
+        "chemistry", "experiment", "laboratory", "theory", "quantum", "astronomy", "gene",
+        "scientific", "molecule", "particle", "evolution", "universe"
+    ],
+    "environment": [
+        "climate", "pollution", "environmental", "green", "sustainability", "conservation",
+        "renewable", "energy", "carbon", "emission", "ecosystem", "biodiversity", "solar",
+        "wind power", "recycling", "waste", "wildlife", "forest", "ocean", "earth"
+    ],
+    "world": [
+        "international", "global", "foreign", "world", "country", "nation", "diplomatic",
+        "embassy", "treaty", "war", "peace", "crisis", "summit", "trade", "united nations",
+        "eu", "european union", "asia", "africa", "middle east"
+    ]
+}
+
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton mapping each keyword to (keyword, categories it scores for)."""
+    keyword_categories: Dict[str, List[str]] = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for keyword in keywords:
+            keyword_categories.setdefault(keyword, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, categories in keyword_categories.items():
+        automaton.add_word(keyword, (keyword, tuple(categories)))
+    automaton.make_automaton()
+    return automaton
+
+# Finds every category keyword in a single pass over the text
+KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    """ISO format of a whole UTC second; only the current second is kept."""
+    return utc_isoformat(datetime.fromtimestamp(second, tz=timezone.utc))
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, formatted once per second across articles."""
+    return _iso_for_second(int(time.time()))
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 or RFC 2822 timestamp, or return None if it is neither.
+    The format is picked up front (RFC 2822 dates contain a comma) so the common
+    case costs one parse attempt.
+    """
+    value = value.strip()
+    try:
+        if "," in value:
+            return parsedate_to_datetime(value)
+        # fromisoformat only accepts a trailing "Z" from Python 3.11
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+def _paragraphs_text(paragraphs: List[lxml.html.HtmlElement]) -> str:
+    """Join paragraph text and normalize its whitespace over the whole block, dropping empty paragraphs."""
+    text = "\n".join(map(methodcaller("text_content"), paragraphs))
+    return INLINE_WHITESPACE.sub(" ", PARAGRAPH_BREAK.sub("\n", text)).strip()
+
+def _make_soup(html: bytes) -> BeautifulSoup:
+    """Parse HTML with the C-backed lxml parser, falling back to html.parser if it fails."""
     try:
-        # Add small delay for politeness
-        time.sleep(random.uniform(1, 3))
-        response = requests.get(url, headers=HEADERS, timeout=timeout)
+        return BeautifulSoup(html, "lxml")
+    except Exception as e:
+        logger.debug("lxml parsing failed, falling back to html.parser: %s", e)
+        return BeautifulSoup(html, "html.parser")
+
+@lru_cache(maxsize=256)
+def _css(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once and reuse it for every page parsed with BeautifulSoup."""
+    return soupsieve.compile(selector)
+
+def _make_link_tree(html: bytes) -> Union[LexborHTMLParser, BeautifulSoup]:
+    """Parse a landing page with the backend configured for link extraction."""
+    if LINK_PARSER == "selectolax":
+        return LexborHTMLParser(html)
+    return _make_soup(html)
+
+def _select_hrefs(tree: Union[LexborHTMLParser, BeautifulSoup], selector: str) -> List[str]:
+    """Get the non-empty href of every element matching a CSS selector."""
+    if isinstance(tree, BeautifulSoup):
+        hrefs = (tag.get("href") for tag in _css(selector).select(tree))
+    else:
+        hrefs = (node.attributes.get("href") for node in tree.css(selector))
+    return [href for href in hrefs if href]
+
+# Per-thread HTTP sessions and HTML parsers, so concurrent workers never share a
+# connection pool or an lxml parser (parser instances are not thread-safe)
+_thread_local = threading.local()
+
+def _session() -> requests.Session:
+    """
+    Get this thread's HTTP session, creating it on first use.
+    Sessions keep connections alive and retry transient failures.
+    """
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _thread_local.session = session
+    return session
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """
+    Get this thread's lxml HTML parser for article pages, creating it on first use.
+    Comments are dropped while parsing so the tree the selectors walk is smaller.
+    """
+    parser = getattr(_thread_local, "html_parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(recover=True, remove_comments=True)
+        _thread_local.html_parser = parser
+    return parser
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    """Get the semaphore limiting concurrent requests to the URL's host."""
+    host = urlparse(url).netloc
+    with _host_semaphores_lock:
+        return _host_semaphores[host]
+
+def _wait_for_host(url: str):
+    """
+    Space out requests to the same host by 1-3 seconds.
+    Only blocks when the previous request to this host was recent; requests
+    to different hosts never wait on each other.
+    """
+    host = urlparse(url).netloc
+    with _host_buckets_lock:
+        bucket = _host_buckets[host]
+    
+    with bucket["lock"]:
+        wait = bucket["next"] - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        bucket["next"] = time.monotonic() + random.uniform(1, 3)
+
+def make_request(url: str, timeout: int = 15, conditional: bool = False) -> Union[bytes, object, None]:
+    """
+    Make an HTTP request with proper error handling and rate limiting.
+    Returns the raw response body so the HTML parser can detect the charset
+    itself instead of paying for a separate decode pass.
+    
+    With conditional=True the ETag/Last-Modified from the previous fetch of the
+    URL are sent, and NOT_MODIFIED is returned when the server answers 304.
+    """
+    headers = {}
+    if conditional:
+        validators = _page_validators.get(url, {})
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    
+    try:
+        # Keep a polite gap since the last request to this host
+        _wait_for_host(url)
+        with _host_semaphore(url):
+            response = _session().get(url, headers=headers, timeout=timeout)
         
         # Log status for debugging
-        logger.info(f"Request to {url}: Status code {response.status_code}")
+        logger.debug("Request to %s: Status code %s", url, response.status_code)
+        
+        if conditional and response.status_code == 304:
+            return NOT_MODIFIED
         
         response.raise_for_status()
-        return response.text
+        if conditional:
+            _page_validators[url] = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified")
+            }
+        return response.content
     except requests.RequestException as e:
-        logger.error(f"Request failed for {url}: {e}")
+        logger.error("Request failed for %s: %s", url, e)
         return None
 
-def extract_article_links_reuters(html: str) -> List[str]:
-    """Extract article links from Reuters (updated for 2024 structure)."""
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-    
-    # Updated selectors for current Reuters layout
-    for article in soup.select("a[data-testid='Heading']"):  # Headings are now in anchor tags
-        href = article.get("href")
-        if href:
-            # Handle relative URLs
-            if href.startswith("/"):
-                href = f"https://www.reuters.com{href}"
-            if "reuters.com/world/" in href:  # Focus on world news links
-                links.add(href)
+# Landing-page link extraction per source
+LINK_EXTRACTION = {
+    "Reuters": SourceSpec(
+        # Headings are now in anchor tags, with story elements as a fallback
+        link_selector="a[data-testid='Heading'], div[data-testid='Story'] a",
+        base_url="https://www.reuters.com/",
+        link_prefixes=("reuters.com/world/",)  # Focus on world news links
+    ),
+    "The Guardian": SourceSpec(
+        # The Guardian has multiple article card styles
+        link_selector=", ".join([
+            "a.js-headline-text",
+            "a[data-link-name='article']",
+            ".fc-item__container a",
+            ".fc-item__link",
+            ".fc-item__content a"
+        ]),
+        base_url="https://www.theguardian.com/",
+        link_prefixes=("theguardian.com/",)
+    ),
+    "AP News": SourceSpec(
+        # AP News card structure
+        link_selector=", ".join([
+            'a[href^="https://apnews.com/article/"]',
+            'a[data-key="card-headline"]',
+            '.CardHeadline a',
+            'div[data-tb-region="Top Headlines"] a'
+        ]),
+        base_url="https://apnews.com/",
+        link_prefixes=("apnews.com/article/",)
+    ),
+    "BBC": SourceSpec(
+        link_selector=", ".join([
+            'a.gs-c-promo-heading',
+            'a.media__link',
+            '.nw-o-link-split__anchor',
+            '.gs-c-promo .gs-c-promo-heading a'
+        ]),
+        base_url="https://www.bbc.com/",
+        link_prefixes=("bbc.com/news", "bbc.co.uk/news")
+    ),
+    "NPR": SourceSpec(
+        link_selector=", ".join([
+            'h2.title a',
+            '.item-info a',
+            '.story-wrap a',
+            '.title a',
+            'h3.title a',
+            'div.story-text a',
+            'article a.title'
+        ]),
+        base_url="https://www.npr.org/",
+        link_prefixes=("npr.org/",)
+    ),
+    "Al Jazeera": SourceSpec(
+        link_selector=", ".join([
+            'article a',
+            '.gc__title a',
+            '.gc__header-wrap a',
+            '.article-card a',
+            '.featured-articles-list a'
+        ]),
+        base_url="https://www.aljazeera.com/",
+        link_prefixes=("aljazeera.com/news", "aljazeera.com/features")
+    )
+}
+
+def _host_path(url: str) -> str:
+    """Lowercase host (without "www.") plus path of an http(s) URL, or "" for any other scheme."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return ""
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host + parts.path
+
+def extract_article_links(source: str, html: bytes) -> List[str]:
+    """Extract article links from a landing page using the source's LINK_EXTRACTION entry."""
+    spec = LINK_EXTRACTION[source]
+    base_url, link_prefixes = spec.base_url, spec.link_prefixes
     
-    # Additional fallback for story elements
-    for story in soup.select("div[data-testid='Story'] a"):
-        href = story.get("href")
-        if href and "/world/" in href:
-            if href.startswith("/"):
-                href = f"https://www.reuters.com{href}"
+    links = set()
+    for href in _select_hrefs(_make_link_tree(html), spec.link_selector):
+        href = urljoin(base_url, href)
+        if _host_path(href).startswith(link_prefixes):
             links.add(href)
     
-    logger.info(f"Reuters extraction found {len(links)} links")
+    logger.info("%s extraction found %d links", source, len(links))
     return list(links)
 
-def extract_article_links_guardian(html: str) -> List[str]:
-    """Extract article links from The Guardian."""
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-    
-    # The Guardian has multiple article card styles
-    selectors = [
-        "a.js-headline-text", 
-        "a[data-link-name='article']",
-        ".fc-item__container a",
-        ".fc-item__link",
-        ".fc-item__content a"
-    ]
-    
-    for selector in selectors:
-        for tag in soup.select(selector):
-            href = tag.get("href")
-            if href:
-                # Handle relative URLs
-                if href.startswith("/"):
-                    href = f"https://www.theguardian.com{href}"
-                if "theguardian.com" in href:
-                    links.add(href)
-    
-    logger.info(f"Guardian extraction found {len(links)} links")
-    return list(links)
+def _generic_link_href(link, source_pattern: str) -> Optional[str]:
+    """Return the absolute href of a streamed <a> element if it looks like an article link."""
+    href = link.get('href')
+    if not href or source_pattern not in href:
+        return None
 
-def extract_article_links_ap(html: str) -> List[str]:
-    """Extract article links from AP News."""
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-    
-    # AP News card structure
-    selectors = [
-        'a[href^="https://apnews.com/article/"]',
-        'a[data-key="card-headline"]',
-        '.CardHeadline a',
-        'div[data-tb-region="Top Headlines"] a'
-    ]
-    
-    for selector in selectors:
-        for link in soup.select(selector):
-            href = link.get('href')
-            if href and "apnews.com/article" in href:
-                links.add(href)
-    
-    logger.info(f"AP News extraction found {len(links)} links")
-    return list(links)
+    # Filter out navigation, footer, etc. by requiring text content or an image
+    if link.find('.//img') is None and len("".join(link.itertext()).strip()) <= 15:
+        return None
 
-def extract_article_links_bbc(html: str) -> List[str]:
-    """Extract article links from BBC."""
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-    
-    # BBC selectors
-    selectors = [
-        'a.gs-c-promo-heading',
-        'a.media__link',
-        '.nw-o-link-split__anchor',
-        '.gs-c-promo .gs-c-promo-heading a'
-    ]
-    
-    for selector in selectors:
-        for link in soup.select(selector):
-            href = link.get('href')
-            if href:
-                # Handle relative URLs
-                if href.startswith('/'):
-                    href = f"https://www.bbc.com{href}"
-                if "bbc.com/news" in href or "bbc.co.uk/news" in href:
-                    links.add(href)
-    
-    logger.info(f"BBC extraction found {len(links)} links")
-    return list(links)
+    # Handle relative URLs
+    if href.startswith('/'):
+        domain = source_pattern.replace('/', '')
+        if '.' not in domain:
+            # Can't determine domain from pattern
+            return None
+        href = f"https://www.{domain}{href}"
+    return href
 
-def extract_article_links_npr(html: str) -> List[str]:
-    """Extract article links from NPR."""
-    soup = BeautifulSoup(html, "html.parser")
+def extract_generic_article_links(html: bytes, source_pattern: str) -> List[str]:
+    """
+    Generic article link extraction for any news source.
+    Streams the page one <a> element at a time and stops once MAX_STREAMED_LINKS
+    links are collected, so the rest of the document is never parsed.
+    """
     links = set()
-    
-    # NPR selectors
-    selectors = [
-        'h2.title a',
-        '.item-info a',
-        '.story-wrap a',
-        '.title a',
-        'h3.title a',
-        'div.story-text a',
-        'article a.title'
-    ]
-    
-    for selector in selectors:
-        for link in soup.select(selector):
-            href = link.get('href')
-            if href and "npr.org" in href:
+    try:
+        for _, link in etree.iterparse(BytesIO(html), events=('end',), tag='a', html=True):
+            href = _generic_link_href(link, source_pattern)
+            # Drop the element's children and text once it has been inspected
+            link.clear()
+            if href:
                 links.add(href)
-    
-    logger.info(f"NPR extraction found {len(links)} links")
+                if len(links) >= MAX_STREAMED_LINKS:
+                    break
+    except etree.XMLSyntaxError as e:
+        # Keep whatever was collected before the parser gave up
+        logger.debug("Stopped streaming links for %s: %s", source_pattern, e)
+
     return list(links)
 
-def extract_article_links_aljazeera(html: str) -> List[str]:
-    """Extract article links from Al Jazeera."""
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-    
-    # Al Jazeera selectors
-    selectors = [
-        'article a',
-        '.gc__title a',
-        '.gc__header-wrap a',
-        '.article-card a',
-        '.featured-articles-list a'
-    ]
+def get_article_links_rss(feed_url: str, limit: int = 20) -> List[str]:
+    """Get article links from an RSS/Atom feed, remembering each entry's date and summary."""
+    content = make_request(feed_url, conditional=True)
+    if content is NOT_MODIFIED:
+        logger.info("Feed %s not modified, reusing previous entries", feed_url)
+        return list(_feed_entries.get(feed_url, {}))
+    if not content:
+        return []
     
-    for selector in selectors:
-        for link in soup.select(selector):
-            href = link.get('href')
-            if href:
-                # Handle relative URLs
-                if href.startswith('/'):
-                    href = f"https://www.aljazeera.com{href}"
-                if "aljazeera.com/news" in href or "aljazeera.com/features" in href:
-                    links.add(href)
+    feed = feedparser.parse(content)
+    entries = {}
+    for entry in feed.entries[:limit]:
+        link = entry.get("link")
+        if not link:
+            continue
+        published = entry.get("published_parsed") or entry.get("updated_parsed")
+        entries[link] = {
+            "published_at": utc_isoformat(datetime(*published[:6])) if published else "",
+            "summary": entry.get("summary", "")
+        }
     
-    logger.info(f"Al Jazeera extraction found {len(links)} links")
-    return list(links)
+    _feed_entries[feed_url] = entries
+    logger.info("Feed %s returned %d links", feed_url, len(entries))
+    return list(entries)
 
-def extract_generic_article_links(html: str, source_pattern: str) -> List[str]:
-    """Generic article link extraction for any news source."""
-    soup = BeautifulSoup(html, "html.parser")
-    links = set()
-    
-    # Look for common article link patterns
-    for link in soup.find_all('a', href=True):
-        href = link.get('href')
-        if href and source_pattern in href and (link.text.strip() or link.find('img')):
-            # Filter out navigation, footer, etc. by requiring text content
-            if len(link.text.strip()) > 15 or link.find('img'):
-                # Handle relative URLs
-                if href.startswith('/'):
-                    domain = source_pattern.replace('/', '')
-                    if '.' in domain:
-                        href = f"https://www.{domain}{href}"
-                    else:
-                        # Can't determine domain from pattern
-                        continue
-                links.add(href)
+def get_feed_entry(url: str) -> Dict[str, str]:
+    """Get the feed metadata recorded for an article link, if any."""
+    for entries in _feed_entries.values():
+        if url in entries:
+            return entries[url]
+    return {}
+
+def get_article_links(source: str, url: str) -> List[str]:
+    """
+    Get article links from a news source, preferring its RSS feed when available.
+    Results are cached for LINK_CACHE_TTL seconds; empty results are not cached.
+    """
+    cache_key = (source, url)
+    with _link_cache_lock:
+        cached = _link_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Using cached links for %s", source)
+        return list(cached)
     
+    links = _fetch_article_links(source, url)
+    if links:
+        with _link_cache_lock:
+            _link_cache[cache_key] = links
     return list(links)
 
-def get_article_links(source: str, url: str) -> List[str]:
-    """Get article links from a news source."""
-    html = make_request(url)
+def _fetch_article_links(source: str, url: str) -> List[str]:
+    """Fetch and extract article links from a source's feed or landing page."""
+    feed_url = RSS_FEEDS.get(source)
+    if feed_url:
+        links = get_article_links_rss(feed_url)
+        if links:
+            logger.info("Found %d links from %s feed", len(links), source)
+            return links
+        logger.warning("No feed entries for %s, falling back to HTML extraction", source)
+    
+    html = make_request(url, conditional=True)
+    if html is NOT_MODIFIED:
+        logger.info("Landing page for %s not modified, reusing previous links", source)
+        return _page_links.get(url, [])
     if not html:
-        logger.warning(f"Failed to fetch content from {source}: {url}")
+        logger.warning("Failed to fetch content from %s: %s", source, url)
         return []
     
-    # Source-specific extraction
-    source_extractors = {
-        "Reuters": extract_article_links_reuters,
-        "The Guardian": extract_article_links_guardian,
-        "AP News": extract_article_links_ap,
-        "BBC": extract_article_links_bbc,
-        "NPR": extract_article_links_npr,
-        "Al Jazeera": extract_article_links_aljazeera
-    }
-    
     # Try source-specific extraction
-    if source in source_extractors:
-        links = source_extractors[source](html)
+    if source in LINK_EXTRACTION:
+        links = extract_article_links(source, html)
     else:
         # Generic fallback extraction
         source_pattern = URL_PATTERNS.get(source, source.lower())
@@ -286,85 +645,41 @@ def get_article_links(source: str, url: str) -> List[str]:
     
     # If no links found with specific extractor, try generic approach
     if not links and source in URL_PATTERNS:
-        logger.warning(f"No links found with specific extractor for {source}, trying generic approach")
+        logger.warning("No links found with specific extractor for %s, trying generic approach", source)
         links = extract_generic_article_links(html, URL_PATTERNS[source])
     
     # Filter out duplicates and limit to top results
     unique_links = list(set(links))
-    logger.info(f"Found {len(unique_links)} links from {source}")
+    logger.info("Found %d links from %s", len(unique_links), source)
     
     # Return top 20 articles per source
     result = unique_links[:min(20, len(unique_links))]
     
     # Debug: print first few links to check
     if result:
-        logger.info(f"First article link: {result[0]}")
+        logger.debug("First article link: %s", result[0])
     
+    # Remember the links so an unchanged page (HTTP 304) can skip parsing
+    _page_links[url] = result
     return result
 
 def detect_article_category(title: str, text: str) -> str:
     """Detect article category based on content using enhanced keyword matching."""
-    # Comprehensive keyword-based categorization with weighted matching
-    categories = {
-        "politics": [
-            "government", "election", "president", "minister", "parliament", "vote", "political",
-            "congress", "senate", "democracy", "policy", "legislation", "campaign", "diplomatic",
-            "republican", "democrat", "bill", "law", "federal", "governor"
-        ],
-        "technology": [
-            "tech", "computer", "software", "internet", "digital", "ai", "artificial intelligence",
-            "cybersecurity", "blockchain", "startup", "innovation", "app", "robot", "automation",
-            "machine learning", "programming", "data", "cloud", "virtual reality", "cryptocurrency"
-        ],
-        "business": [
-            "economy", "market", "stock", "trade", "company", "financial", "investment",
-            "revenue", "profit", "startup", "entrepreneur", "industry", "corporate", "commerce",
-            "banking", "inflation", "economic", "gdp", "nasdaq", "dow jones"
-        ],
-        "health": [
-            "covid", "virus", "disease", "medical", "hospital", "doctor", "healthcare", "health",
-            "patient", "treatment", "medicine", "vaccine", "research", "clinical", "drug",
-            "therapy", "mental health", "wellness", "diagnosis", "pharmaceutical"
-        ],
-        "entertainment": [
-            "movie", "film", "music", "celebrity", "actor", "actress", "concert",
-            "hollywood", "tv", "television", "streaming", "award", "star", "entertainment",
-            "show", "series", "album", "theater", "festival", "performance"
-        ],
-        "sports": [
-            "football", "soccer", "basketball", "tournament", "championship", "olympic", "player",
-            "game", "match", "team", "athlete", "sport", "baseball", "tennis", "golf",
-            "league", "coach", "score", "win", "competition"
-        ],
-        "science": [
-            "research", "scientist", "study", "discovery", "space", "nasa", "physics", "biology",
-            "chemistry", "experiment", "laboratory", "theory", "quantum", "astronomy", "gene",
-            "scientific", "molecule", "particle", "evolution", "universe"
-        ],
-        "environment": [
-            "climate", "pollution", "environmental", "green", "sustainability", "conservation",
-            "renewable", "energy", "carbon", "emission", "ecosystem", "biodiversity", "solar",
-            "wind power", "recycling", "waste", "wildlife", "forest", "ocean", "earth"
-        ],
-        "world": [
-            "international", "global", "foreign", "world", "country", "nation", "diplomatic",
-            "embassy", "treaty", "war", "peace", "crisis", "summit", "trade", "united nations",
-            "eu", "european union", "asia", "africa", "middle east"
-        ]
-    }
+    # Each keyword counts once per field, however often it occurs, so short keywords
+    # inside common words ("ai" in "said") can't outweigh real matches
+    title_hits = {hit for _, hit in KEYWORD_AUTOMATON.iter(title.lower())}
+    content_hits = title_hits.union(hit for _, hit in KEYWORD_AUTOMATON.iter(text.lower()))
     
-    content = (title + " " + text).lower()
-    category_scores = {cat: 0 for cat in categories}
-    
-    # Calculate score for each category
-    for category, keywords in categories.items():
-        # Title matches are worth more (3x)
-        title_lower = title.lower()
-        for keyword in keywords:
-            if keyword in title_lower:
-                category_scores[category] += 3
-            if keyword in content:
-                category_scores[category] += 1
+    # Calculate score for each category; title matches are worth more (3x)
+    category_scores = dict.fromkeys(CATEGORY_KEYWORDS, 0)
+    title_categories = set()
+    for _, categories in title_hits:
+        for category in categories:
+            category_scores[category] += 3
+            title_categories.add(category)
+    for _, categories in content_hits:
+        for category in categories:
+            category_scores[category] += 1
     
     # Get category with highest score
     max_score = max(category_scores.values())
@@ -372,176 +687,293 @@ def detect_article_category(title: str, text: str) -> str:
         # If there's a tie, prefer the category that matches in the title
         top_categories = [cat for cat, score in category_scores.items() if score == max_score]
         for cat in top_categories:
-            if any(keyword in title.lower() for keyword in categories[cat]):
+            if cat in title_categories:
                 return cat
         return top_categories[0]
     
     return "general"
 
-def scrape_article(url: str) -> Optional[Dict]:
+def detect_article_categories_bulk(articles: List[Tuple[str, str]]) -> List[str]:
+    """Detect categories for a batch of (title, text) pairs."""
+    return [detect_article_category(title, text) for title, text in articles]
+
+def _ensure_nltk():
+    """
+    Make sure the NLTK tokenizer data needed by article.nlp() is available.
+    The filesystem probe runs at most once per process, and is skipped
+    entirely when NLTK_DATA_READY is set in the environment.
+    """
+    global _nltk_ready
+    if _nltk_ready or os.getenv("NLTK_DATA_READY"):
+        _nltk_ready = True
+        return
+
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt')
+
+    try:
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        nltk.download('punkt_tab')
+
+    _nltk_ready = True
+    # Let worker processes started from here skip the probe
+    os.environ["NLTK_DATA_READY"] = "1"
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared process pool used for article parsing, creating it if needed."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            # Check NLTK data once here so the workers inherit NLTK_DATA_READY
+            _ensure_nltk()
+            context = multiprocessing.get_context(PARSE_START_METHOD)
+            if PARSE_START_METHOD == "forkserver":
+                # Import this module once in the fork server instead of in every worker
+                context.set_forkserver_preload(["scraper"])
+            _parse_pool = ProcessPoolExecutor(max_workers=PARSE_WORKERS, mp_context=context)
+        return _parse_pool
+
+def _parse_in_pool(url: str, html: bytes) -> Dict[str, Any]:
+    """
+    Extract an article in the parse pool.
+    If a worker died and broke the pool, the pool is dropped so the next call starts a fresh one.
+    """
+    global _parse_pool
+    pool = get_parse_pool()
+    try:
+        return pool.submit(_extract_article, url, html).result(timeout=PARSE_TIMEOUT)
+    except BrokenProcessPool:
+        logger.error("Parse pool broke while parsing %s, restarting it", url)
+        with _parse_pool_lock:
+            if _parse_pool is pool:
+                _parse_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+
+def _parse_and_nlp(url: str, html: bytes) -> Dict[str, Any]:
+    """
+    Parse downloaded article HTML and run newspaper3k NLP.
+    Runs in a worker process, so only plain picklable values are returned.
+    """
+    article = Article(url)
+    article.set_html(html)
+    article.parse()
+    
+    # Try to run NLP, but don't fail if it doesn't work
+    try:
+        _ensure_nltk()
+        article.nlp()  # Extract keywords and summary
+    except Exception as nlp_error:
+        logger.warning("NLP processing failed for %s: %s", url, nlp_error)
+        # Continue without NLP results
+    
+    return {
+        "title": article.title,
+        "text": article.text,
+        "top_image": article.top_image or "",
+        "published_at": utc_isoformat(article.publish_date) if article.publish_date else None,
+        "keywords": list(article.keywords) if article.keywords else [],
+        "summary": article.summary or ""
+    }
+
+def _extract_article(url: str, html: bytes) -> Dict[str, Any]:
+    """
+    Extract article fields from downloaded HTML with trafilatura, falling back
+    to newspaper3k parsing and NLP when trafilatura finds no article text.
+    Runs in a worker process, so only plain picklable values are returned.
+    """
+    # Read the extracted document directly rather than rendering it to JSON and parsing that back
+    document = trafilatura.bare_extraction(
+        html,
+        url=url,
+        with_metadata=True,
+        include_images=True,
+        favor_precision=True,
+        # Passing date_extraction_params replaces trafilatura's defaults, so start
+        # from them to keep the original-date and extensive searches
+        date_extraction_params={**set_date_params(True), "outputformat": "%Y-%m-%d"}
+    )
+    if document and document.text:
+        published = parse_datetime(document.date) if document.date else None
+        return {
+            "title": document.title or "",
+            "text": document.text,
+            "top_image": document.image or "",
+            "published_at": utc_isoformat(published) if published else None,
+            "keywords": [tag.strip() for tag in document.tags or [] if tag.strip()],
+            "summary": document.description or ""
+        }
+    
+    return _parse_and_nlp(url, html)
+
+def scrape_article(url: str) -> Optional[ScrapedArticle]:
     """Scrape article content from URL with enhanced error handling."""
     try:
         # Special handling for Reuters articles due to their authentication requirements
         if "reuters.com" in url:
-            response = requests.get(url, headers=HEADERS, timeout=15)
+            with _host_semaphore(url):
+                response = _session().get(url, timeout=15)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
+            root = lxml.html.fromstring(response.content, parser=_html_parser())
             
             # Extract title - Reuters uses multiple possible title selectors
             title = ""
-            title_selectors = [
-                "h1[data-testid='Heading']",
-                "h1.article-header__title__3Y2hh",
-                "h1.text__text__1FZLe",
-                ".article-header h1"
-            ]
-            for selector in title_selectors:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.text.strip()
+            for selector in REUTERS_TITLE_SELECTORS:
+                title_elems = selector(root)
+                if title_elems:
+                    title = title_elems[0].text_content().strip()
                     break
             
             # Extract text - Reuters uses multiple possible content selectors
             text = ""
-            content_selectors = [
-                "p[data-testid='paragraph-']",  # Numbered paragraphs
-                ".article-body__content__17Yit p",
-                ".paywall-article p",
-                ".article__content p",
-                ".StandardArticleBody_body p",
-                ".article-body p"  # New Reuters format
-            ]
-            for selector in content_selectors:
-                paragraphs = soup.select(selector)
-                if paragraphs:
-                    text = "\n".join([p.text.strip() for p in paragraphs if p.text.strip()])
-                    if text:  # If we found content, stop looking
-                        break
+            for selector in REUTERS_CONTENT_SELECTORS:
+                text = _paragraphs_text(selector(root))
+                if text:  # If we found content, stop looking
+                    break
             
             # If still no text, try a more generic approach
             if not text:
                 # Look for any paragraph that might contain article content
-                paragraphs = soup.find_all('p')
-                text = "\n".join([p.text.strip() for p in paragraphs 
-                                if len(p.text.strip()) > 50  # Only substantial paragraphs
-                                and not any(skip in p.get('class', []) 
-                                          for skip in ['caption', 'footer', 'header', 'meta'])])
+                text = _paragraphs_text(SUBSTANTIAL_PARAGRAPHS(root))
             
             # Extract image - Reuters uses multiple possible image selectors
             image_url = ""
-            image_selectors = [
-                "img[data-testid='Image']",
-                ".article-header__image__2nPGa img",
-                ".article__hero-image img",
-                "meta[property='og:image']",
-                ".article-body img"  # New Reuters format
-            ]
-            for selector in image_selectors:
-                img_elem = soup.select_one(selector)
-                if img_elem:
-                    image_url = img_elem.get("src") or img_elem.get("content", "")
+            for selector in REUTERS_IMAGE_SELECTORS:
+                img_elems = selector(root)
+                if img_elems:
+                    image_url = img_elems[0].get("src") or img_elems[0].get("content", "")
                     if image_url:
                         break
             
             # Extract date - Reuters uses multiple possible date selectors
-            published_at = datetime.utcnow().isoformat()
-            date_selectors = [
-                "time",
-                "meta[property='article:published_time']",
-                ".ArticleHeader_date",
-                ".article-info time"  # New Reuters format
-            ]
-            for selector in date_selectors:
-                time_elem = soup.select_one(selector)
-                if time_elem:
-                    datetime_str = time_elem.get("datetime") or time_elem.get("content")
-                    if datetime_str:
-                        try:
-                            published_at = datetime.fromisoformat(datetime_str).isoformat()
-                            break
-                        except ValueError:
-                            pass
+            published_at = ""
+            for selector in REUTERS_DATE_SELECTORS:
+                time_elems = selector(root)
+                if time_elems:
+                    datetime_str = time_elems[0].get("datetime") or time_elems[0].get("content")
+                    parsed_date = parse_datetime(datetime_str) if datetime_str else None
+                    if parsed_date:
+                        published_at = utc_isoformat(parsed_date)
+                        break
             
             # Validate article
-            if not title or not text or len(text) < 100:
-                logger.warning(f"Invalid Reuters article content for {url}: Title exists: {bool(title)}, Text length: {len(text) if text else 0}")
+            if not title or len(text) < MIN_ARTICLE_CHARS:
+                logger.warning("Invalid Reuters article content for %s: Title exists: %s, Text length: %d", url, bool(title), len(text))
                 return None
                 
             category = detect_article_category(title, text)
             
-            return {
-                "title": title,
-                "text": text,
-                "url": url,
-                "image_url": image_url,
-                "published_at": published_at,
-                "keywords": [],  # Reuters articles don't expose keywords
-                "category": category,
-                "source_summary": ""  # No built-in summary for Reuters
-            }
+            return ScrapedArticle(
+                title=title,
+                text=text,
+                url=url,
+                image_url=image_url,
+                published_at=published_at or _now_iso(),  # Fall back to scrape time
+                keywords=[],  # Reuters articles don't expose keywords
+                category=category,
+                source_summary=""  # No built-in summary for Reuters
+            )
         
-        # For non-Reuters articles, use the original newspaper3k approach
-        article = Article(url)
-        article.config.browser_user_agent = HEADERS["User-Agent"]
-        article.download()
-        article.parse()
+        # For non-Reuters articles, download through this thread's pooled session
+        # and hand the CPU-bound extraction to the process pool
+        with _host_semaphore(url):
+            response = _session().get(url, timeout=15)
+        response.raise_for_status()
+        parsed = _parse_in_pool(url, response.content)
         
-        # Try to run NLP, but don't fail if it doesn't work
-        try:
-            article.nlp()  # Extract keywords and summary
-        except Exception as nlp_error:
-            logger.warning(f"NLP processing failed for {url}: {nlp_error}")
-            # Continue without NLP results
+        # Feed metadata fills in anything the extractor couldn't find
+        feed_entry = get_feed_entry(url)
         
         # Validate article
-        if not article.title or not article.text or len(article.text) < 100:
-            logger.warning(f"Invalid article content for {url}: Title exists: {bool(article.title)}, Text length: {len(article.text) if article.text else 0}")
+        title, text = parsed["title"], parsed["text"] or ""
+        if not title or len(text) < MIN_ARTICLE_CHARS:
+            logger.warning("Invalid article content for %s: Title exists: %s, Text length: %d", url, bool(title), len(text))
             return None
             
-        category = detect_article_category(article.title, article.text)
+        category = detect_article_category(title, text)
         
-        # Get keywords if NLP worked, otherwise empty list
-        keywords = article.keywords if hasattr(article, 'keywords') and article.keywords else []
-        
-        return {
-            "title": article.title,
-            "text": article.text,
-            "url": url,
-            "image_url": article.top_image or "",
-            "published_at": article.publish_date.isoformat() if article.publish_date else datetime.utcnow().isoformat(),
-            "keywords": keywords,
-            "category": category,
-            "source_summary": article.summary if hasattr(article, 'summary') else ""  # Newspaper's built-in summary as backup
-        }
+        return ScrapedArticle(
+            title=title,
+            text=text,
+            url=url,
+            image_url=parsed["top_image"],
+            # Prefer the feed's full timestamp; extracted page dates may lack the time
+            published_at=feed_entry.get("published_at") or parsed["published_at"] or _now_iso(),
+            keywords=parsed["keywords"],
+            category=category,
+            source_summary=parsed["summary"] or feed_entry.get("summary", "")  # Built-in or feed summary as backup
+        )
     except ArticleException as e:
-        logger.error(f"ArticleException for {url}: {e}")
+        logger.error("ArticleException for %s: %s", url, e)
         return None
     except Exception as e:
-        logger.error(f"Failed to scrape article {url}: {e}")
+        logger.error("Failed to scrape article %s: %s", url, e)
         return None
 
+def scrape_articles_bulk(urls: List[str], max_workers: int = 16) -> Iterator[Tuple[str, Optional[ScrapedArticle]]]:
+    """
+    Scrape many articles concurrently.
+    Yields (url, article) pairs as they complete; article is None when scraping failed.
+    Requests to any single host are still capped at MAX_REQUESTS_PER_HOST.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_url = {executor.submit(scrape_article, url): url for url in urls}
+        for future in as_completed(future_to_url):
+            yield future_to_url[future], future.result()
+
+def collect_source_links(names: List[str]) -> Dict[str, List[str]]:
+    """Get article links for each named source concurrently, keyed by source name."""
+    with ThreadPoolExecutor(max_workers=max(1, len(names))) as executor:
+        return dict(zip(names, executor.map(lambda name: get_article_links(name, SOURCES[name]), names)))
+
 
 if __name__ == "__main__":
-    # Test the scraper with verbose output for each source
-    for source_name, source_url in SOURCES.items():
-        print(f"\nTesting scraper for {source_name}")
-        links = get_article_links(source_name, source_url)
-        print(f"Found {len(links)} links")
+    import argparse
+
+    parser = argparse.ArgumentParser(description="News scraper")
+    parser.add_argument("--test", action="store_true", help="Run a test scrape against each source")
+    parser.add_argument("--sources", help="Comma-separated sources to test (default: all)")
+    args = parser.parse_args()
+
+    if not args.test:
+        parser.print_help()
+        sys.exit(0)
+
+    source_names = [name.strip() for name in args.sources.split(",")] if args.sources else list(SOURCES)
+    unknown = [name for name in source_names if name not in SOURCES]
+    if unknown:
+        parser.error(f"Unknown source(s): {', '.join(unknown)}. Available sources: {', '.join(SOURCES)}")
+
+    # Collect links from every source concurrently, then scrape each source's first article
+    source_links = collect_source_links(source_names)
+    scraped = dict(scrape_articles_bulk([links[0] for links in source_links.values() if links]))
+
+    # Test the scraper with verbose output for each source, collected and written once
+    lines = []
+    for source_name in source_names:
+        lines.append(f"\nTesting scraper for {source_name}")
+        links = source_links[source_name]
+        lines.append(f"Found {len(links)} links")
         
         if links:
-            print(f"First 3 links:")
+            lines.append("First 3 links:")
             for i, link in enumerate(links[:3]):
-                print(f"{i+1}. {link}")
+                lines.append(f"{i+1}. {link}")
                 
-            print("\nTesting article scraping for first link...")
-            article_data = scrape_article(links[0])
+            lines.append("\nTesting article scraping for first link...")
+            article_data = scraped.get(links[0])
             
             if article_data:
-                print(f"Successfully scraped: {article_data['title']}")
-                print(f"Category: {article_data['category']}")
-                print(f"Image URL: {article_data['image_url']}")
-                print(f"Summary length: {len(article_data.get('source_summary', ''))}")
+                lines.append(f"Successfully scraped: {article_data.title}")
+                lines.append(f"Category: {article_data.category}")
+                lines.append(f"Image URL: {article_data.image_url}")
+                lines.append(f"Summary length: {len(article_data.source_summary)}")
             else:
-                print(f"Failed to scrape article from {links[0]}")
+                lines.append(f"Failed to scrape article from {links[0]}")
         
-        print("-" * 50)
\ No newline at end of file
+        lines.append("-" * 50)
+
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -2,12 +2,17 @@
 Enhanced text summarization module using Google's Gemini API.
 """
 import os
+import hashlib
+import re
 import requests
+import threading
 import time
-from typing import Optional
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from cachetools import LRUCache
 from dotenv import load_dotenv
 import logging
-from newspaper import fulltext
 
 # Configure logging
 logging.basicConfig(
@@ -25,22 +30,81 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")  # Default to empty string if n
 # Endpoint
 GEMINI_API_URL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent"
 
+# Article text sent to Gemini is cut to this many characters, at a word boundary
+MAX_PROMPT_CHARS = 8000
+
+# Prompt sent to Gemini, filled in with format_map()
+PROMPT_TEMPLATE = """
+Summarize the following {category} news article in 3-4 concise sentences that capture the key points.
+
+Source: {source}
+
+Article:
+{text}
+
+Summary:
+"""
+
+# Maximum Gemini requests in flight at once, across all threads
+MAX_CONCURRENT_REQUESTS = 4
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Long-lived pool for summarize_many, so its threads' sessions stay warm between calls
+_summary_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="summarizer")
+
+# Whitespace following sentence-ending punctuation
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
+# Texts shorter than this are used as their own fallback summary
+SHORT_TEXT_CHARS = 400
+
+# Summaries already generated in this process, keyed by _summary_key()
+_summary_cache = LRUCache(maxsize=4096)
+_summary_cache_lock = threading.Lock()
+
+# Each thread keeps its own session so calls reuse a kept-alive connection to the API
+_thread_local = threading.local()
+
+def _session() -> requests.Session:
+    """Get this thread's pooled session for Gemini API calls, creating it if needed."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update({"Content-Type": "application/json"})
+        # Retries stay in summarize_text, so the adapter only pools connections
+        session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        _thread_local.session = session
+    return session
+
+def _truncate(text: str, max_len: int = MAX_PROMPT_CHARS) -> str:
+    """Cut text to at most max_len characters, ending at a word boundary where possible."""
+    if len(text) <= max_len:
+        return text
+    cut = text.rfind(" ", 0, max_len + 1)
+    return text[:cut if cut > 0 else max_len]
+
+def _summary_key(text: str, source: str, category: str) -> str:
+    """Cache key covering everything that goes into the Gemini prompt."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return f"{digest}:{source}:{category}"
+
 def summarize_with_gemini(text: str, source: str = "", category: str = "general") -> Optional[str]:
     """Summarize text using Google's Gemini API."""
     if not GEMINI_API_KEY:
         logger.warning("Gemini API key not found")
         return None
-        
-    prompt = f"""
-    Summarize the following {category} news article in 3-4 concise sentences that capture the key points.
-    
-    Source: {source}
     
-    Article:
-    {text[:8000]}  # Limit text to prevent excessive tokens
+    # Limit text to prevent excessive tokens
+    text = _truncate(text)
     
-    Summary:
-    """
+    # Identical article content was already summarized, so skip the API call
+    key = _summary_key(text, source, category)
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+    if cached:
+        return cached
+        
+    prompt = PROMPT_TEMPLATE.format_map({"category": category, "source": source, "text": text})
     
     data = {
         "contents": [{
@@ -52,49 +116,45 @@ def summarize_with_gemini(text: str, source: str = "", category: str = "general"
         }
     }
     
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
     try:
-        response = requests.post(
-            f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
-            json=data,
-            headers=headers,
-            timeout=30
-        )
+        with _request_slots:
+            response = _session().post(
+                f"{GEMINI_API_URL}?key={GEMINI_API_KEY}",
+                json=data,
+                timeout=30
+            )
         response.raise_for_status()
         result = response.json()
         
         candidates = result.get("candidates", [])
         if candidates and candidates[0].get("content", {}).get("parts", []):
-            summary = candidates[0]["content"]["parts"][0]["text"]
-            return summary.strip()
+            summary = candidates[0]["content"]["parts"][0]["text"].strip()
+            with _summary_cache_lock:
+                _summary_cache[key] = summary
+            return summary
         else:
             logger.warning("No summary content in Gemini response")
             return None
     except requests.RequestException as e:
-        logger.error(f"Gemini API request failed: {e}")
+        logger.error("Gemini API request failed: %s", e)
         return None
     except Exception as e:
-        logger.error(f"Error in Gemini summarization: {e}")
+        logger.error("Error in Gemini summarization: %s", e)
         return None
 
 def simple_text_fallback(text: str, source: str = "") -> str:
     """Create a simple fallback summary without using NLP libraries."""
     try:
-        # Split text into sentences (very basic approach)
-        sentences = []
-        for sent in text.replace("\n", " ").split(". "):
-            if sent.strip():
-                sentences.append(sent.strip() + ("." if not sent.endswith(".") else ""))
+        text = text.strip()
+        if len(text) < SHORT_TEXT_CHARS:
+            summary = text.replace("\n", " ")
+        else:
+            # Simple extractive summary - first 3 sentences; only those are split off the text
+            sentences = SENTENCE_BOUNDARY.split(text, maxsplit=3)[:3]
+            summary = " ".join(sentences).replace("\n", " ")
         
-        if not sentences:
+        if not summary:
             return text[:300] + "..."
-            
-        # Simple extractive summary - first 3 sentences
-        summary_sentences = sentences[:min(3, len(sentences))]
-        summary = " ".join(summary_sentences)
         
         # Add source attribution
         if source:
@@ -102,7 +162,7 @@ def simple_text_fallback(text: str, source: str = "") -> str:
             
         return summary
     except Exception as e:
-        logger.error(f"Fallback summarization failed: {e}")
+        logger.error("Fallback summarization failed: %s", e)
         return text[:300] + "..."  # Absolute fallback
 
 def summarize_text(article_text: str, source: str = "", category: str = "general", 
@@ -128,7 +188,7 @@ def summarize_text(article_text: str, source: str = "", category: str = "general
         summary = summarize_with_gemini(article_text, source, category)
         if summary:
             return summary
-        logger.info(f"Gemini API attempt {attempt+1} failed, retrying...")
+        logger.info("Gemini API attempt %d failed, retrying...", attempt+1)
         time.sleep(1)  # Wait before retry
     
     # If Gemini API fails, use simple fallback
@@ -139,6 +199,12 @@ def summarize_text(article_text: str, source: str = "", category: str = "general
     # Final fallback
     return article_text[:300] + f"... (Source: {source})"
 
+def summarize_many(articles: List[Tuple[str, str, str]]) -> List[str]:
+    """
+    Summarize many (text, source, category) tuples concurrently so API round-trips overlap.
+    Summaries are returned in input order.
+    """
+    return list(_summary_executor.map(lambda article: summarize_text(*article), articles))
 
 if __name__ == "__main__":
     # Test the summarizer